@@ -31,6 +31,8 @@
 #include <string>
 #include <bitset>
 #include <memory>
+#include <algorithm>
+#include <cstring>
 
 struct VendorSpecificInfo {
     EnableFlags vendor_id;
@@ -138,20 +140,31 @@ const char* DepReasonToString(ExtDeprecationReason reason) {
     }
 }
 
+// The generated extension tables are sorted by extension name, so look entries up with a binary search
+template <typename Table>
+static auto FindExtensionEntry(const Table& table, const char* extension_name) -> decltype(table.begin()) {
+    auto compare_name = [](const typename Table::value_type& entry, const char* name) { return strcmp(entry.name, name) < 0; };
+    auto it = std::lower_bound(table.begin(), table.end(), extension_name, compare_name);
+    if ((it != table.end()) && (strcmp(it->name, extension_name) != 0)) {
+        it = table.end();
+    }
+    return it;
+}
+
 bool BestPractices::ValidateDeprecatedExtensions(const char* api_name, const char* extension_name, uint32_t version,
                                                  const char* vuid) const {
     bool skip = false;
-    auto dep_info_it = deprecated_extensions.find(extension_name);
+    auto dep_info_it = FindExtensionEntry(deprecated_extensions, extension_name);
     if (dep_info_it != deprecated_extensions.end()) {
-        auto dep_info = dep_info_it->second;
-        if (((dep_info.target.compare("VK_VERSION_1_1") == 0) && (version >= VK_API_VERSION_1_1)) ||
-            ((dep_info.target.compare("VK_VERSION_1_2") == 0) && (version >= VK_API_VERSION_1_2)) ||
-            ((dep_info.target.compare("VK_VERSION_1_3") == 0) && (version >= VK_API_VERSION_1_3))) {
+        const auto& dep_info = dep_info_it->data;
+        if (((strcmp(dep_info.target, "VK_VERSION_1_1") == 0) && (version >= VK_API_VERSION_1_1)) ||
+            ((strcmp(dep_info.target, "VK_VERSION_1_2") == 0) && (version >= VK_API_VERSION_1_2)) ||
+            ((strcmp(dep_info.target, "VK_VERSION_1_3") == 0) && (version >= VK_API_VERSION_1_3))) {
             skip |=
                 LogWarning(instance, vuid, "%s(): Attempting to enable deprecated extension %s, but this extension has been %s %s.",
-                           api_name, extension_name, DepReasonToString(dep_info.reason), (dep_info.target).c_str());
-        } else if (dep_info.target.find("VK_VERSION") == std::string::npos) {
-            if (dep_info.target.length() == 0) {
+                           api_name, extension_name, DepReasonToString(dep_info.reason), dep_info.target);
+        } else if (strstr(dep_info.target, "VK_VERSION") == nullptr) {
+            if (dep_info.target[0] == '\0') {
                 skip |= LogWarning(instance, vuid,
                                    "%s(): Attempting to enable deprecated extension %s, but this extension has been deprecated "
                                    "without replacement.",
@@ -159,7 +172,7 @@ bool BestPractices::ValidateDeprecatedExtensions(const char* api_name, const cha
             } else {
                 skip |= LogWarning(instance, vuid,
                                    "%s(): Attempting to enable deprecated extension %s, but this extension has been %s %s.",
-                                   api_name, extension_name, DepReasonToString(dep_info.reason), (dep_info.target).c_str());
+                                   api_name, extension_name, DepReasonToString(dep_info.reason), dep_info.target);
             }
         }
     }
@@ -169,30 +182,30 @@ bool BestPractices::ValidateDeprecatedExtensions(const char* api_name, const cha
 bool BestPractices::ValidateSpecialUseExtensions(const char* api_name, const char* extension_name, const SpecialUseVUIDs& special_use_vuids) const
 {
     bool skip = false;
-    auto dep_info_it = special_use_extensions.find(extension_name);
+    auto dep_info_it = FindExtensionEntry(special_use_extensions, extension_name);
 
     if (dep_info_it != special_use_extensions.end()) {
         const char* const format = "%s(): Attempting to enable extension %s, but this extension is intended to support %s "
                                    "and it is strongly recommended that it be otherwise avoided.";
-        auto& special_uses = dep_info_it->second;
+        const char* const special_uses = dep_info_it->uses;
 
-        if (special_uses.find("cadsupport") != std::string::npos) {
+        if (strstr(special_uses, "cadsupport") != nullptr) {
             skip |= LogWarning(instance, special_use_vuids.cadsupport, format, api_name, extension_name,
                                "specialized functionality used by CAD/CAM applications");
         }
-        if (special_uses.find("d3demulation") != std::string::npos) {
+        if (strstr(special_uses, "d3demulation") != nullptr) {
             skip |= LogWarning(instance, special_use_vuids.d3demulation, format, api_name, extension_name,
                 "D3D emulation layers, and applications ported from D3D, by adding functionality specific to D3D");
         }
-        if (special_uses.find("devtools") != std::string::npos) {
+        if (strstr(special_uses, "devtools") != nullptr) {
             skip |= LogWarning(instance, special_use_vuids.devtools, format, api_name, extension_name,
                 "developer tools such as capture-replay libraries");
         }
-        if (special_uses.find("debugging") != std::string::npos) {
+        if (strstr(special_uses, "debugging") != nullptr) {
             skip |= LogWarning(instance, special_use_vuids.debugging, format, api_name, extension_name,
                 "use by applications when debugging");
         }
-        if (special_uses.find("glemulation") != std::string::npos) {
+        if (strstr(special_uses, "glemulation") != nullptr) {
             skip |= LogWarning(instance, special_use_vuids.glemulation, format, api_name, extension_name,
                 "OpenGL and/or OpenGL ES emulation layers, and applications ported from those APIs, by adding functionality "
                 "specific to those APIs");
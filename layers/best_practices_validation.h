@@ -26,6 +26,7 @@
 #include "image_state.h"
 #include "cmd_buffer_state.h"
 #include <string>
+#include <array>
 
 static const uint32_t kMemoryObjectWarningLimit = 250;
 
@@ -108,7 +109,18 @@ enum ExtDeprecationReason {
 
 struct DeprecationData {
     ExtDeprecationReason reason;
-    std::string target;
+    const char* target;
+};
+
+// Entries of the generated extension tables, kept as plain aggregates so the tables can be constexpr in C++11
+struct DeprecatedExtensionEntry {
+    const char* name;
+    DeprecationData data;
+};
+
+struct SpecialUseEntry {
+    const char* name;
+    const char* uses;
 };
 
 struct SpecialUseVUIDs {
@@ -1323,10 +1323,6 @@ void BestPractices::PostCallRecordGetPhysicalDeviceVideoCapabilitiesKHR(
     }
 }
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void BestPractices::PostCallRecordGetPhysicalDeviceVideoFormatPropertiesKHR(
     VkPhysicalDevice                            physicalDevice,
     const VkPhysicalDeviceVideoFormatInfoKHR*   pVideoFormatInfo,
@@ -1341,10 +1337,6 @@ void BestPractices::PostCallRecordGetPhysicalDeviceVideoFormatPropertiesKHR(
     }
 }
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void BestPractices::PostCallRecordCreateVideoSessionKHR(
     VkDevice                                    device,
     const VkVideoSessionCreateInfoKHR*          pCreateInfo,
@@ -1359,10 +1351,6 @@ void BestPractices::PostCallRecordCreateVideoSessionKHR(
     }
 }
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void BestPractices::PostCallRecordGetVideoSessionMemoryRequirementsKHR(
     VkDevice                                    device,
     VkVideoSessionKHR                           videoSession,
@@ -1377,10 +1365,6 @@ void BestPractices::PostCallRecordGetVideoSessionMemoryRequirementsKHR(
     }
 }
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void BestPractices::PostCallRecordBindVideoSessionMemoryKHR(
     VkDevice                                    device,
     VkVideoSessionKHR                           videoSession,
@@ -1395,10 +1379,6 @@ void BestPractices::PostCallRecordBindVideoSessionMemoryKHR(
     }
 }
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void BestPractices::PostCallRecordCreateVideoSessionParametersKHR(
     VkDevice                                    device,
     const VkVideoSessionParametersCreateInfoKHR* pCreateInfo,
@@ -1413,10 +1393,6 @@ void BestPractices::PostCallRecordCreateVideoSessionParametersKHR(
     }
 }
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void BestPractices::PostCallRecordUpdateVideoSessionParametersKHR(
     VkDevice                                    device,
     VkVideoSessionParametersKHR                 videoSessionParameters,
@@ -1473,10 +1449,6 @@ void BestPractices::PostCallRecordGetMemoryWin32HandleKHR(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordGetMemoryWin32HandlePropertiesKHR(
     VkDevice                                    device,
     VkExternalMemoryHandleTypeFlagBits          handleType,
@@ -1534,10 +1506,6 @@ void BestPractices::PostCallRecordImportSemaphoreWin32HandleKHR(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordGetSemaphoreWin32HandleKHR(
     VkDevice                                    device,
     const VkSemaphoreGetWin32HandleInfoKHR*     pGetWin32HandleInfo,
@@ -1632,10 +1600,6 @@ void BestPractices::PostCallRecordImportFenceWin32HandleKHR(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordGetFenceWin32HandleKHR(
     VkDevice                                    device,
     const VkFenceGetWin32HandleInfoKHR*         pGetWin32HandleInfo,
@@ -2165,10 +2129,6 @@ void BestPractices::PostCallRecordAcquireXlibDisplayEXT(
     }
 }
 
-#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
-
-#ifdef VK_USE_PLATFORM_XLIB_XRANDR_EXT
-
 void BestPractices::PostCallRecordGetRandROutputDisplayEXT(
     VkPhysicalDevice                            physicalDevice,
     Display*                                    dpy,
@@ -2371,10 +2331,6 @@ void BestPractices::PostCallRecordGetAndroidHardwareBufferPropertiesANDROID(
     }
 }
 
-#endif // VK_USE_PLATFORM_ANDROID_KHR
-
-#ifdef VK_USE_PLATFORM_ANDROID_KHR
-
 void BestPractices::PostCallRecordGetMemoryAndroidHardwareBufferANDROID(
     VkDevice                                    device,
     const VkMemoryGetAndroidHardwareBufferInfoANDROID* pInfo,
@@ -2745,10 +2701,6 @@ void BestPractices::PostCallRecordGetPhysicalDeviceSurfacePresentModes2EXT(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordAcquireFullScreenExclusiveModeEXT(
     VkDevice                                    device,
     VkSwapchainKHR                              swapchain,
@@ -2761,10 +2713,6 @@ void BestPractices::PostCallRecordAcquireFullScreenExclusiveModeEXT(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordReleaseFullScreenExclusiveModeEXT(
     VkDevice                                    device,
     VkSwapchainKHR                              swapchain,
@@ -2777,10 +2725,6 @@ void BestPractices::PostCallRecordReleaseFullScreenExclusiveModeEXT(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordGetDeviceGroupSurfacePresentModes2EXT(
     VkDevice                                    device,
     const VkPhysicalDeviceSurfaceInfo2KHR*      pSurfaceInfo,
@@ -2894,10 +2838,6 @@ void BestPractices::PostCallRecordAcquireWinrtDisplayNV(
     }
 }
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void BestPractices::PostCallRecordGetWinrtDisplayNV(
     VkPhysicalDevice                            physicalDevice,
     uint32_t                                    deviceRelativeId,
@@ -2946,10 +2886,6 @@ void BestPractices::PostCallRecordGetMemoryZirconHandleFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordGetMemoryZirconHandlePropertiesFUCHSIA(
     VkDevice                                    device,
     VkExternalMemoryHandleTypeFlagBits          handleType,
@@ -2964,10 +2900,6 @@ void BestPractices::PostCallRecordGetMemoryZirconHandlePropertiesFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordImportSemaphoreZirconHandleFUCHSIA(
     VkDevice                                    device,
     const VkImportSemaphoreZirconHandleInfoFUCHSIA* pImportSemaphoreZirconHandleInfo,
@@ -2980,10 +2912,6 @@ void BestPractices::PostCallRecordImportSemaphoreZirconHandleFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordGetSemaphoreZirconHandleFUCHSIA(
     VkDevice                                    device,
     const VkSemaphoreGetZirconHandleInfoFUCHSIA* pGetZirconHandleInfo,
@@ -2997,10 +2925,6 @@ void BestPractices::PostCallRecordGetSemaphoreZirconHandleFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordCreateBufferCollectionFUCHSIA(
     VkDevice                                    device,
     const VkBufferCollectionCreateInfoFUCHSIA*  pCreateInfo,
@@ -3015,10 +2939,6 @@ void BestPractices::PostCallRecordCreateBufferCollectionFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordSetBufferCollectionImageConstraintsFUCHSIA(
     VkDevice                                    device,
     VkBufferCollectionFUCHSIA                   collection,
@@ -3032,10 +2952,6 @@ void BestPractices::PostCallRecordSetBufferCollectionImageConstraintsFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordSetBufferCollectionBufferConstraintsFUCHSIA(
     VkDevice                                    device,
     VkBufferCollectionFUCHSIA                   collection,
@@ -3049,10 +2965,6 @@ void BestPractices::PostCallRecordSetBufferCollectionBufferConstraintsFUCHSIA(
     }
 }
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void BestPractices::PostCallRecordGetBufferCollectionPropertiesFUCHSIA(
     VkDevice                                    device,
     VkBufferCollectionFUCHSIA                   collection,
@@ -3235,3 +3147,5 @@ void BestPractices::PostCallRecordGetRayTracingCaptureReplayShaderGroupHandlesKH
 
 
 
+constexpr std::array<DeprecatedExtensionEntry, 90> BestPractices::deprecated_extensions;
+constexpr std::array<SpecialUseEntry, 25> BestPractices::special_use_extensions;
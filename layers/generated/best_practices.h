@@ -755,10 +755,6 @@ void PostCallRecordGetPhysicalDeviceVideoCapabilitiesKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void PostCallRecordGetPhysicalDeviceVideoFormatPropertiesKHR(
     VkPhysicalDevice                            physicalDevice,
     const VkPhysicalDeviceVideoFormatInfoKHR*   pVideoFormatInfo,
@@ -767,10 +763,6 @@ void PostCallRecordGetPhysicalDeviceVideoFormatPropertiesKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void PostCallRecordCreateVideoSessionKHR(
     VkDevice                                    device,
     const VkVideoSessionCreateInfoKHR*          pCreateInfo,
@@ -779,10 +771,6 @@ void PostCallRecordCreateVideoSessionKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void PostCallRecordGetVideoSessionMemoryRequirementsKHR(
     VkDevice                                    device,
     VkVideoSessionKHR                           videoSession,
@@ -791,10 +779,6 @@ void PostCallRecordGetVideoSessionMemoryRequirementsKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void PostCallRecordBindVideoSessionMemoryKHR(
     VkDevice                                    device,
     VkVideoSessionKHR                           videoSession,
@@ -803,10 +787,6 @@ void PostCallRecordBindVideoSessionMemoryKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void PostCallRecordCreateVideoSessionParametersKHR(
     VkDevice                                    device,
     const VkVideoSessionParametersCreateInfoKHR* pCreateInfo,
@@ -815,10 +795,6 @@ void PostCallRecordCreateVideoSessionParametersKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_ENABLE_BETA_EXTENSIONS
-
-#ifdef VK_ENABLE_BETA_EXTENSIONS
-
 void PostCallRecordUpdateVideoSessionParametersKHR(
     VkDevice                                    device,
     VkVideoSessionParametersKHR                 videoSessionParameters,
@@ -851,10 +827,6 @@ void PostCallRecordGetMemoryWin32HandleKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordGetMemoryWin32HandlePropertiesKHR(
     VkDevice                                    device,
     VkExternalMemoryHandleTypeFlagBits          handleType,
@@ -888,10 +860,6 @@ void PostCallRecordImportSemaphoreWin32HandleKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordGetSemaphoreWin32HandleKHR(
     VkDevice                                    device,
     const VkSemaphoreGetWin32HandleInfoKHR*     pGetWin32HandleInfo,
@@ -944,10 +912,6 @@ void PostCallRecordImportFenceWin32HandleKHR(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordGetFenceWin32HandleKHR(
     VkDevice                                    device,
     const VkFenceGetWin32HandleInfoKHR*         pGetWin32HandleInfo,
@@ -1247,10 +1211,6 @@ void PostCallRecordAcquireXlibDisplayEXT(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_XLIB_XRANDR_EXT
-
-#ifdef VK_USE_PLATFORM_XLIB_XRANDR_EXT
-
 void PostCallRecordGetRandROutputDisplayEXT(
     VkPhysicalDevice                            physicalDevice,
     Display*                                    dpy,
@@ -1368,10 +1328,6 @@ void PostCallRecordGetAndroidHardwareBufferPropertiesANDROID(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_ANDROID_KHR
-
-#ifdef VK_USE_PLATFORM_ANDROID_KHR
-
 void PostCallRecordGetMemoryAndroidHardwareBufferANDROID(
     VkDevice                                    device,
     const VkMemoryGetAndroidHardwareBufferInfoANDROID* pInfo,
@@ -1578,30 +1534,18 @@ void PostCallRecordGetPhysicalDeviceSurfacePresentModes2EXT(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordAcquireFullScreenExclusiveModeEXT(
     VkDevice                                    device,
     VkSwapchainKHR                              swapchain,
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordReleaseFullScreenExclusiveModeEXT(
     VkDevice                                    device,
     VkSwapchainKHR                              swapchain,
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordGetDeviceGroupSurfacePresentModes2EXT(
     VkDevice                                    device,
     const VkPhysicalDeviceSurfaceInfo2KHR*      pSurfaceInfo,
@@ -1667,10 +1611,6 @@ void PostCallRecordAcquireWinrtDisplayNV(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_WIN32_KHR
-
-#ifdef VK_USE_PLATFORM_WIN32_KHR
-
 void PostCallRecordGetWinrtDisplayNV(
     VkPhysicalDevice                            physicalDevice,
     uint32_t                                    deviceRelativeId,
@@ -1701,10 +1641,6 @@ void PostCallRecordGetMemoryZirconHandleFUCHSIA(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordGetMemoryZirconHandlePropertiesFUCHSIA(
     VkDevice                                    device,
     VkExternalMemoryHandleTypeFlagBits          handleType,
@@ -1713,20 +1649,12 @@ void PostCallRecordGetMemoryZirconHandlePropertiesFUCHSIA(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordImportSemaphoreZirconHandleFUCHSIA(
     VkDevice                                    device,
     const VkImportSemaphoreZirconHandleInfoFUCHSIA* pImportSemaphoreZirconHandleInfo,
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordGetSemaphoreZirconHandleFUCHSIA(
     VkDevice                                    device,
     const VkSemaphoreGetZirconHandleInfoFUCHSIA* pGetZirconHandleInfo,
@@ -1734,10 +1662,6 @@ void PostCallRecordGetSemaphoreZirconHandleFUCHSIA(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordCreateBufferCollectionFUCHSIA(
     VkDevice                                    device,
     const VkBufferCollectionCreateInfoFUCHSIA*  pCreateInfo,
@@ -1746,10 +1670,6 @@ void PostCallRecordCreateBufferCollectionFUCHSIA(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordSetBufferCollectionImageConstraintsFUCHSIA(
     VkDevice                                    device,
     VkBufferCollectionFUCHSIA                   collection,
@@ -1757,10 +1677,6 @@ void PostCallRecordSetBufferCollectionImageConstraintsFUCHSIA(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordSetBufferCollectionBufferConstraintsFUCHSIA(
     VkDevice                                    device,
     VkBufferCollectionFUCHSIA                   collection,
@@ -1768,10 +1684,6 @@ void PostCallRecordSetBufferCollectionBufferConstraintsFUCHSIA(
     VkResult                                    result) override;
 
 
-#endif // VK_USE_PLATFORM_FUCHSIA
-
-#ifdef VK_USE_PLATFORM_FUCHSIA
-
 void PostCallRecordGetBufferCollectionPropertiesFUCHSIA(
     VkDevice                                    device,
     VkBufferCollectionFUCHSIA                   collection,
@@ -1882,7 +1794,7 @@ void PostCallRecordGetRayTracingCaptureReplayShaderGroupHandlesKHR(
 
 
 
-const layer_data::unordered_map<std::string, DeprecationData>  deprecated_extensions = {
+static constexpr std::array<DeprecatedExtensionEntry, 90> deprecated_extensions = {{
     {"VK_AMD_draw_indirect_count", {kExtPromoted, "VK_KHR_draw_indirect_count"}},
     {"VK_AMD_gpu_shader_half_float", {kExtDeprecated, "VK_KHR_shader_float16_int8"}},
     {"VK_AMD_gpu_shader_int16", {kExtDeprecated, "VK_KHR_shader_float16_int8"}},
@@ -1973,9 +1885,9 @@ const layer_data::unordered_map<std::string, DeprecationData>  deprecated_extens
     {"VK_NV_external_memory_win32", {kExtDeprecated, "VK_KHR_external_memory_win32"}},
     {"VK_NV_glsl_shader", {kExtDeprecated, ""}},
     {"VK_NV_win32_keyed_mutex", {kExtPromoted, "VK_KHR_win32_keyed_mutex"}},
-};
+}};
 
-const layer_data::unordered_map<std::string, std::string> special_use_extensions = {
+static constexpr std::array<SpecialUseEntry, 25> special_use_extensions = {{
     {"VK_AMD_buffer_marker", "devtools"},
     {"VK_AMD_shader_info", "devtools"},
     {"VK_EXT_border_color_swizzle", "glemulation, d3demulation"},
@@ -2001,5 +1913,5 @@ const layer_data::unordered_map<std::string, std::string> special_use_extensions
     {"VK_KHR_pipeline_executable_properties", "devtools"},
     {"VK_VALVE_descriptor_set_host_mapping", "d3demulation"},
     {"VK_VALVE_mutable_descriptor_type", "d3demulation"},
-};
+}};
 
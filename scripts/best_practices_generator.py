@@ -20,6 +20,7 @@
 # Author: Nadav Geva <nadav.geva@amd.com>
 
 import os,re,sys,string,json
+import io
 import xml.etree.ElementTree as etree
 from generator import *
 from collections import namedtuple
@@ -28,6 +29,49 @@ from common_codegen import *
 # This is a workaround to use a Python 2.7 and 3.x compatible syntax
 from io import open
 
+# Splits a VkResult-returning C prototype from makeCDecls() into the command name (without vk) and its parameter list
+vkresult_proto_rx = re.compile(r'VKAPI_ATTR VkResult VKAPI_CALL vk(\w+)\((.*)\);', re.S)
+
+# Commands which are not autogenerated but still intercepted
+NO_AUTOGEN_COMMANDS = frozenset({
+    'vkEnumerateInstanceVersion',
+    'vkCreateValidationCacheEXT',
+    'vkDestroyValidationCacheEXT',
+    'vkMergeValidationCachesEXT',
+    'vkGetValidationCacheDataEXT',
+    })
+
+# Commands that require an extra parameter for state sharing between validate/record steps
+EXTRA_PARAMETER_COMMANDS = frozenset({
+    "vkCreateShaderModule",
+    "vkCreateGraphicsPipelines",
+    "vkCreateComputePipelines",
+    "vkAllocateDescriptorSets",
+    "vkCreateRayTracingPipelinesNV",
+    "vkCreateRayTracingPipelinesKHR",
+    })
+
+# Commands that have a manually written post-call-record step which needs to be called from the autogen'd fcn
+MANUAL_POSTCALLRECORD_COMMANDS = frozenset({
+    'vkAllocateDescriptorSets',
+    'vkAllocateMemory',
+    'vkQueuePresentKHR',
+    'vkQueueBindSparse',
+    'vkCreateGraphicsPipelines',
+    'vkGetPhysicalDeviceSurfaceCapabilitiesKHR',
+    'vkGetPhysicalDeviceSurfaceCapabilities2KHR',
+    'vkGetPhysicalDeviceSurfaceCapabilities2EXT',
+    'vkGetPhysicalDeviceSurfacePresentModesKHR',
+    'vkGetPhysicalDeviceSurfaceFormatsKHR',
+    'vkGetPhysicalDeviceSurfaceFormats2KHR',
+    'vkGetPhysicalDeviceDisplayPlanePropertiesKHR',
+    'vkGetSwapchainImagesKHR',
+    # AMD tracked
+    'vkCreateComputePipelines',
+    'vkCmdPipelineBarrier',
+    'vkQueueSubmit',
+    })
+
 class BestPracticesOutputGeneratorOptions(GeneratorOptions):
     def __init__(self,
                  conventions = None,
@@ -82,61 +126,90 @@ class BestPracticesOutputGeneratorOptions(GeneratorOptions):
 #
 # BestPracticesOutputGenerator(errFile, warnFile, diagFile)
 class BestPracticesOutputGenerator(OutputGenerator):
+    # OutputGenerator keeps a __dict__ for its own state; the members added by this generator live in slots
+    __slots__ = (
+        'no_autogen_list',
+        'extra_parameter_list',
+        'manual_postcallrecord_list',
+        'return_codes',
+        'current_protect',
+        'deprecated_extensions',
+        'special_use_extensions',
+        'out_buffer',
+        )
+
+    inline_copyright_message = """// *** THIS FILE IS GENERATED - DO NOT EDIT ***
+// See best_practices_generator.py for modifications
+
+
+/***************************************************************************
+ *
+ * Copyright (c) 2015-2022 The Khronos Group Inc.
+ * Copyright (c) 2015-2022 Valve Corporation
+ * Copyright (c) 2015-2022 LunarG, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+ * Author: Mark Lobodzinski <mark@lunarg.com>
+ * Author: Nadav Geva <nadav.geva@amd.com>
+ *
+ ****************************************************************************/
+"""
+
     def __init__(self,
                  errFile = sys.stderr,
                  warnFile = sys.stderr,
                  diagFile = sys.stdout):
         OutputGenerator.__init__(self, errFile, warnFile, diagFile)
-        # Commands which are not autogenerated but still intercepted
-        self.no_autogen_list = [
-            'vkEnumerateInstanceVersion',
-            'vkCreateValidationCacheEXT',
-            'vkDestroyValidationCacheEXT',
-            'vkMergeValidationCachesEXT',
-            'vkGetValidationCacheDataEXT',
-            ]
-        # Commands that require an extra parameter for state sharing between validate/record steps
-        self.extra_parameter_list = [
-            "vkCreateShaderModule",
-            "vkCreateGraphicsPipelines",
-            "vkCreateComputePipelines",
-            "vkAllocateDescriptorSets",
-            "vkCreateRayTracingPipelinesNV",
-            "vkCreateRayTracingPipelinesKHR",
-            ]
-        # Commands that have a manually written post-call-record step which needs to be called from the autogen'd fcn
-        self.manual_postcallrecord_list = [
-            'vkAllocateDescriptorSets',
-            'vkAllocateMemory',
-            'vkQueuePresentKHR',
-            'vkQueueBindSparse',
-            'vkCreateGraphicsPipelines',
-            'vkGetPhysicalDeviceSurfaceCapabilitiesKHR',
-            'vkGetPhysicalDeviceSurfaceCapabilities2KHR',
-            'vkGetPhysicalDeviceSurfaceCapabilities2EXT',
-            'vkGetPhysicalDeviceSurfacePresentModesKHR',
-            'vkGetPhysicalDeviceSurfaceFormatsKHR',
-            'vkGetPhysicalDeviceSurfaceFormats2KHR',
-            'vkGetPhysicalDeviceDisplayPlanePropertiesKHR',
-            'vkGetSwapchainImagesKHR',
-            # AMD tracked
-            'vkCreateComputePipelines',
-            'vkCmdPipelineBarrier',
-            'vkQueueSubmit',
-            ]
+        self.no_autogen_list = set(NO_AUTOGEN_COMMANDS)
+        self.extra_parameter_list = EXTRA_PARAMETER_COMMANDS
+        self.manual_postcallrecord_list = MANUAL_POSTCALLRECORD_COMMANDS
 
-        self.extension_info = dict()
+        # Memoized getReturnCodes() results, keyed by the registry errorcodes/successcodes attributes
+        self.return_codes = dict()
+        # Platform protection of the #ifdef block currently open in the output, if any
+        self.current_protect = None
+        # All output is collected here and written to the output file once, at the end of endFile()
+        self.out_buffer = None
+        # Extension data is partitioned into the two emitted tables as each feature is processed
+        self.deprecated_extensions = dict()
+        self.special_use_extensions = dict()
     #
     # Separate content for validation source and header files
     def otwrite(self, dest, formatstring):
         if 'best_practices.h' in self.genOpts.filename and (dest == 'hdr' or dest == 'both'):
-            write(formatstring, file=self.outFile)
+            write(formatstring, file=self.out_buffer)
         elif 'best_practices.cpp' in self.genOpts.filename and (dest == 'cpp' or dest == 'both'):
-            write(formatstring, file=self.outFile)
+            write(formatstring, file=self.out_buffer)
+    #
+    # Blank lines go through the same buffer as the rest of the output
+    def newline(self):
+        self.otwrite('both', '')
+    #
+    # Switch the open #ifdef block to protect, so runs of commands sharing a platform share a single guard
+    def setProtect(self, protect):
+        if protect == self.current_protect:
+            return
+        if self.current_protect is not None:
+            self.otwrite('both', '#endif // %s\n' % self.current_protect)
+        if protect is not None:
+            self.otwrite('both', '#ifdef %s\n' % protect)
+        self.current_protect = protect
     #
     # Called at beginning of processing as file is opened
     def beginFile(self, genOpts):
         OutputGenerator.beginFile(self, genOpts)
+        self.out_buffer = io.StringIO()
 
         header_file = (genOpts.filename == 'best_practices.h')
         source_file = (genOpts.filename == 'best_practices.cpp')
@@ -145,42 +218,15 @@ class BestPracticesOutputGenerator(OutputGenerator):
             print("Error: Output Filenames have changed, update generator source.\n")
             sys.exit(1)
 
-        # File Comment
-        file_comment = '// *** THIS FILE IS GENERATED - DO NOT EDIT ***\n'
-        file_comment += '// See best_practices_generator.py for modifications\n'
-        self.otwrite('both', file_comment)
-        # Copyright Statement
-        copyright = ''
-        copyright += '\n'
-        copyright += '/***************************************************************************\n'
-        copyright += ' *\n'
-        copyright += ' * Copyright (c) 2015-2022 The Khronos Group Inc.\n'
-        copyright += ' * Copyright (c) 2015-2022 Valve Corporation\n'
-        copyright += ' * Copyright (c) 2015-2022 LunarG, Inc.\n'
-        copyright += ' *\n'
-        copyright += ' * Licensed under the Apache License, Version 2.0 (the "License");\n'
-        copyright += ' * you may not use this file except in compliance with the License.\n'
-        copyright += ' * You may obtain a copy of the License at\n'
-        copyright += ' *\n'
-        copyright += ' *     http://www.apache.org/licenses/LICENSE-2.0\n'
-        copyright += ' *\n'
-        copyright += ' * Unless required by applicable law or agreed to in writing, software\n'
-        copyright += ' * distributed under the License is distributed on an "AS IS" BASIS,\n'
-        copyright += ' * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.\n'
-        copyright += ' * See the License for the specific language governing permissions and\n'
-        copyright += ' * limitations under the License.\n'
-        copyright += ' *\n'
-        copyright += ' * Author: Mark Lobodzinski <mark@lunarg.com>\n'
-        copyright += ' * Author: Nadav Geva <nadav.geva@amd.com>\n'
-        copyright += ' *\n'
-        copyright += ' ****************************************************************************/\n'
-        self.otwrite('both', copyright)
+        # File comment and copyright statement
+        self.otwrite('both', self.inline_copyright_message)
         self.newline()
         self.otwrite('cpp', '#include "chassis.h"')
         self.otwrite('cpp', '#include "best_practices_validation.h"')
     #
     # Now that the data is all collected and complete, generate and output the object validation routines
     def endFile(self):
+        self.setProtect(None)
         self.newline()
         # Actually write the interface to the output file.
         if (self.emit):
@@ -194,28 +240,28 @@ class BestPracticesOutputGenerator(OutputGenerator):
             else:
                 self.otwrite('both', '\n')
 
+            # Extension tables are emitted as constexpr arrays sorted by extension name, which
+            # best_practices_utils.cpp searches with std::lower_bound
+            deprecation_type = 'std::array<DeprecatedExtensionEntry, %d>' % len(self.deprecated_extensions)
+            special_use_type = 'std::array<SpecialUseEntry, %d>' % len(self.special_use_extensions)
+
             # Output data structure containing extension deprecation data
-            ext_deprecation_data = 'const layer_data::unordered_map<std::string, DeprecationData>  deprecated_extensions = {\n'
-            for ext in sorted(self.extension_info):
-                ext_data = self.extension_info[ext]
-                reason = ext_data[0]
-                target = ext_data[1]
-                if reason is not None:
-                    ext_deprecation_data += '    {"%s", {kExt%s, "%s"}},\n' % (ext, reason, target)
-            ext_deprecation_data += '};\n'
-            self.otwrite('hdr', ext_deprecation_data)
+            entries = ''.join(f'    {{"{ext}", {{kExt{reason}, "{target}"}}}},\n'
+                              for ext, (reason, target) in sorted(self.deprecated_extensions.items()))
+            self.otwrite('hdr', f'static constexpr {deprecation_type} deprecated_extensions = {{{{\n{entries}}}}};\n')
 
             # Output data structure containing extension special use data
-            ext_specialuse_data = 'const layer_data::unordered_map<std::string, std::string> special_use_extensions = {\n'
-            for ext in sorted(self.extension_info):
-                spec_use_data = self.extension_info[ext]
-                special_uses = spec_use_data[2]
-                if special_uses is not None:
-                    special_uses = special_uses.replace(',', ', ')
-                    ext_specialuse_data += '    {"%s", "%s"},\n' % (ext, special_uses)
-            ext_specialuse_data += '};\n'
-            self.otwrite('hdr', ext_specialuse_data)
+            entries = ''.join(f'    {{"{ext}", "{special_uses.replace(",", ", ")}"}},\n'
+                              for ext, special_uses in sorted(self.special_use_extensions.items()))
+            self.otwrite('hdr', f'static constexpr {special_use_type} special_use_extensions = {{{{\n{entries}}}}};\n')
+
+            # The tables are odr-used by the lookups, so they need a namespace scope definition prior to C++17
+            self.otwrite('cpp', 'constexpr %s BestPractices::deprecated_extensions;' % deprecation_type)
+            self.otwrite('cpp', 'constexpr %s BestPractices::special_use_extensions;' % special_use_type)
 
+        # Hand the complete file to the output stream in a single write
+        self.outFile.write(self.out_buffer.getvalue())
+        self.out_buffer = None
         OutputGenerator.endFile(self)
     #
     # Processing point at beginning of each extension definition
@@ -224,23 +270,24 @@ class BestPracticesOutputGenerator(OutputGenerator):
         self.featureExtraProtect = GetFeatureProtect(interface)
         ext_name = interface.attrib.get('name')
         ext_special_use = interface.attrib.get('specialuse')
-        ext_promoted = (interface.attrib.get('promotedto'))
+        deprecation_info = self.getDeprecationInfo(interface)
+        if deprecation_info is not None:
+            self.deprecated_extensions[ext_name] = deprecation_info
+        if ext_special_use is not None:
+            self.special_use_extensions[ext_name] = ext_special_use
+    #
+    # Return the (reason, target) deprecation pair for an extension, or None if it is still current
+    def getDeprecationInfo(self, interface):
+        ext_promoted = interface.attrib.get('promotedto')
+        if ext_promoted is not None:
+            return ('Promoted', ext_promoted)
         ext_obsoleted = interface.attrib.get('obsoletedby')
+        if ext_obsoleted is not None:
+            return ('Obsoleted', ext_obsoleted)
         ext_deprecated = interface.attrib.get('deprecatedby')
-        if ext_promoted is not None:
-           reason = 'Promoted'
-           target = ext_promoted
-        elif ext_obsoleted is not None:
-           reason = 'Obsoleted'
-           target = ext_obsoleted
-        elif ext_deprecated is not None:
-           reason = 'Deprecated'
-           target = ext_deprecated
-        else:
-            reason = None
-            target = None
-        if reason is not None or ext_special_use is not None:
-            self.extension_info[ext_name] = [reason, target, ext_special_use]
+        if ext_deprecated is not None:
+            return ('Deprecated', ext_deprecated)
+        return None
 
     #
     # Retrieve the type and name for a parameter
@@ -254,63 +301,58 @@ class BestPracticesOutputGenerator(OutputGenerator):
                 name = noneStr(elem.text)
         return (type, name)
     #
+    # Return the (error_codes, success_codes) lists to check for a command, or None if it can only return VK_SUCCESS.
+    # Many commands share the same codes, so results are memoized on the registry attribute strings.
+    def getReturnCodes(self, cmd):
+        key = (cmd.attrib.get('errorcodes'), cmd.attrib.get('successcodes'))
+        if key not in self.return_codes:
+            error_codes, success_codes = key
+            success_codes = success_codes.split(',') if success_codes is not None else []
+            success_codes = ','.join(code for code in success_codes if code != 'VK_SUCCESS')
+            if error_codes is None and success_codes == '':
+                self.return_codes[key] = None
+            else:
+                self.return_codes[key] = (error_codes if error_codes is not None else '', success_codes)
+        return self.return_codes[key]
+    #
     # Capture command parameter info needed to create, destroy, and validate objects
     def genCmd(self, cmdinfo, cmdname, alias):
         OutputGenerator.genCmd(self, cmdinfo, cmdname, alias)
-        intercept = ''
         if cmdname in self.no_autogen_list:
-            intercept += '// Skipping %s for autogen as it has a manually created custom function or ignored.\n' % cmdname
-            self.otwrite('cpp', intercept)
+            if self.current_protect != self.featureExtraProtect:
+                self.setProtect(None)
+            self.otwrite('cpp', '// Skipping %s for autogen as it has a manually created custom function or ignored.\n' % cmdname)
             return
-        cdecl=self.makeCDecls(cmdinfo.elem)[0]
-        decls = self.makeCDecls(cmdinfo.elem)
-        typedef = decls[1]
-        typedef = typedef.split(')',1)[1]
-        pre_decl = decls[0][:-1]
-        pre_decl = pre_decl.split("VKAPI_CALL ")[1]
-        pre_decl = pre_decl.replace(')', ',\n    VkResult                                    result)')
-        if cmdname in self.extra_parameter_list:
-            pre_decl = pre_decl.replace(')', ',\n    void*                                       state_data)')
-        pre_decl = pre_decl.replace(')', ') {\n')
-        pre_decl = 'void BestPractices::PostCallRecord' + pre_decl[2:]
-        type = cdecl.split(' ')[1]
-        if type == 'VkResult':
-            error_codes = cmdinfo.elem.attrib.get('errorcodes')
-            success_codes = cmdinfo.elem.attrib.get('successcodes')
-            success_codes = success_codes.replace('VK_SUCCESS,','')
-            success_codes = success_codes.replace('VK_SUCCESS','')
-            if error_codes is None and success_codes == '':
-                return
-            if self.featureExtraProtect is not None:
-                self.otwrite('both', '#ifdef %s\n' % self.featureExtraProtect)
-            func_decl = pre_decl.replace(' {',' override;\n');
-            func_decl = func_decl.replace('BestPractices::', '')
-            self.otwrite('hdr', func_decl)
-            intercept += pre_decl
-            params_text = ''
-            params = cmdinfo.elem.findall('param')
-            for param in params:
-                paramtype,paramname = self.getTypeNameTuple(param)
-                params_text += '%s, ' % paramname
-            params_text = params_text + 'result, '
-            if cmdname in self.extra_parameter_list:
-                params_text += 'state_data, '
-            params_text = params_text[:-2] + ');\n'
-            intercept += '    ValidationStateTracker::PostCallRecord'+cmdname[2:] + '(' + params_text
-            if cmdname in self.manual_postcallrecord_list:
-                intercept += '    ManualPostCallRecord'+cmdname[2:] + '(' + params_text
-            intercept += '    if (result != VK_SUCCESS) {\n'
-            if error_codes is not None:
-                intercept += '        static const std::vector<VkResult> error_codes = {%s};\n' % error_codes
-            else:
-                intercept += '        static const std::vector<VkResult> error_codes = {};\n'
-            if success_codes is not None:
-                intercept += '        static const std::vector<VkResult> success_codes = {%s};\n' % success_codes
-            else:
-                intercept += '        static const std::vector<VkResult> success_codes = {};\n'
-            intercept += '        ValidateReturnCodes("%s", result, error_codes, success_codes);\n' % cmdname
-            intercept += '    }\n'
-            intercept += '}\n'
-            self.otwrite('cpp', intercept)
-            if self.featureExtraProtect is not None:
-                self.otwrite('both', '#endif // %s\n' % self.featureExtraProtect)
+        # Only commands returning a VkResult with non-trivial return codes get an autogen'd function,
+        # so make the C declarations once and bail out before any further parsing of the prototype
+        proto_match = vkresult_proto_rx.match(self.makeCDecls(cmdinfo.elem)[0])
+        if proto_match is None:
+            return
+        return_codes = self.getReturnCodes(cmdinfo.elem)
+        if return_codes is None:
+            return
+        error_codes, success_codes = return_codes
+        # Derive the shared parameter list once, then build the header and source prototypes from it
+        has_state_data = cmdname in self.extra_parameter_list
+        state_data_decl = ',\n    void*                                       state_data' if has_state_data else ''
+        post_proto = '%s(%s,\n    VkResult                                    result%s)' % (proto_match.group(1), proto_match.group(2), state_data_decl)
+        func_decl = 'void PostCallRecord' + post_proto + ' override;\n\n'
+        pre_decl = 'void BestPractices::PostCallRecord' + post_proto + ' {\n'
+        self.setProtect(self.featureExtraProtect)
+        self.otwrite('hdr', func_decl)
+        get_type_name = self.getTypeNameTuple
+        params_text = ', '.join(get_type_name(param)[1] for param in cmdinfo.elem.iterfind('param'))
+        params_text += ', result, state_data' if has_state_data else ', result'
+        short_name = cmdname[2:]
+        intercept = io.StringIO()
+        intercept.write(pre_decl)
+        intercept.write(f'    ValidationStateTracker::PostCallRecord{short_name}({params_text});\n')
+        if cmdname in self.manual_postcallrecord_list:
+            intercept.write(f'    ManualPostCallRecord{short_name}({params_text});\n')
+        intercept.write('    if (result != VK_SUCCESS) {\n')
+        intercept.write('        static const std::vector<VkResult> error_codes = {%s};\n' % error_codes)
+        intercept.write('        static const std::vector<VkResult> success_codes = {%s};\n' % success_codes)
+        intercept.write('        ValidateReturnCodes("%s", result, error_codes, success_codes);\n' % cmdname)
+        intercept.write('    }\n')
+        intercept.write('}\n')
+        self.otwrite('cpp', intercept.getvalue())
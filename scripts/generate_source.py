@@ -19,6 +19,7 @@
 # Author: Mike Schuchardt <mikes@lunarg.com>
 
 import argparse
+import concurrent.futures
 import filecmp
 import os
 import shutil
@@ -29,6 +30,9 @@ import difflib
 
 import common_codegen
 
+# upper bound on the number of lvl_genvk.py processes run concurrently
+max_concurrent_generators = 8
+
 # files to exclude from --verify check
 verify_exclude = ['.clang-format',
                   'gpu_pre_draw_shader.h'] # Requires glslangvalidator, so updated manually when needed
@@ -42,53 +46,56 @@ def main(argv):
     group.add_argument('-v', '--verify', action='store_true', help='verify repo files match generator output')
     args = parser.parse_args(argv)
 
-    gen_cmds = [*[[common_codegen.repo_relative('scripts/lvl_genvk.py'),
-                   '-registry', os.path.abspath(os.path.join(args.registry,  'vk.xml')),
-                   '-grammar', os.path.abspath(os.path.join(args.grammar,  'spirv.core.grammar.json')),
-                   '-warnExtensions', 'VK_KHR_dynamic_rendering',
-                   '-quiet',
-                   filename] for filename in ["chassis.cpp",
-                                              "chassis.h",
-                                              "chassis_dispatch_helper.h",
-                                              "layer_chassis_dispatch.cpp",
-                                              "layer_chassis_dispatch.h",
-                                              "object_tracker.cpp",
-                                              "object_tracker.h",
-                                              "parameter_validation.cpp",
-                                              "parameter_validation.h",
-                                              "synchronization_validation_types.cpp",
-                                              "synchronization_validation_types.h",
-                                              "thread_safety.cpp",
-                                              "thread_safety.h",
-                                              "vk_dispatch_table_helper.h",
-                                              "vk_enum_string_helper.h",
-                                              "vk_extension_helper.h",
-                                              "vk_layer_dispatch_table.h",
-                                              "vk_object_types.h",
-                                              "vk_safe_struct.cpp",
-                                              "vk_safe_struct.h",
-                                              "lvt_function_pointers.cpp",
-                                              "lvt_function_pointers.h",
-                                              "vk_typemap_helper.h",
-                                              "best_practices.h",
-                                              "best_practices.cpp",
-                                              "spirv_validation_helper.cpp",
-                                              "spirv_grammar_helper.cpp",
-                                              "spirv_grammar_helper.h",
-                                              "command_validation.cpp",
-                                              "command_validation.h",
-                                              "vk_format_utils.cpp",
-                                              "vk_format_utils.h",
-                                              "corechecks_optick_instrumentation.cpp",
-                                              "corechecks_optick_instrumentation.h"]],
-                [common_codegen.repo_relative('scripts/vk_validation_stats.py'),
-                 os.path.abspath(os.path.join(args.registry, 'validusage.json')),
-                 '-export_header'],
-                [common_codegen.repo_relative('scripts/external_revision_generator.py'),
-                 '--json_file', common_codegen.repo_relative('scripts/known_good.json'),
-                 '--json_keys', 'repos,3,commit',
-                 '-s', 'SPIRV_TOOLS_COMMIT_ID',
-                 '-o', 'spirv_tools_commit_id.h']]
+    # lvl_genvk.py invocations only read the registry and each write their own file, so they can run concurrently
+    lvl_genvk_cmds = [[common_codegen.repo_relative('scripts/lvl_genvk.py'),
+                      '-registry', os.path.abspath(os.path.join(args.registry,  'vk.xml')),
+                      '-grammar', os.path.abspath(os.path.join(args.grammar,  'spirv.core.grammar.json')),
+                      '-warnExtensions', 'VK_KHR_dynamic_rendering',
+                      '-quiet',
+                      filename] for filename in ["chassis.cpp",
+                                                 "chassis.h",
+                                                 "chassis_dispatch_helper.h",
+                                                 "layer_chassis_dispatch.cpp",
+                                                 "layer_chassis_dispatch.h",
+                                                 "object_tracker.cpp",
+                                                 "object_tracker.h",
+                                                 "parameter_validation.cpp",
+                                                 "parameter_validation.h",
+                                                 "synchronization_validation_types.cpp",
+                                                 "synchronization_validation_types.h",
+                                                 "thread_safety.cpp",
+                                                 "thread_safety.h",
+                                                 "vk_dispatch_table_helper.h",
+                                                 "vk_enum_string_helper.h",
+                                                 "vk_extension_helper.h",
+                                                 "vk_layer_dispatch_table.h",
+                                                 "vk_object_types.h",
+                                                 "vk_safe_struct.cpp",
+                                                 "vk_safe_struct.h",
+                                                 "lvt_function_pointers.cpp",
+                                                 "lvt_function_pointers.h",
+                                                 "vk_typemap_helper.h",
+                                                 "best_practices.h",
+                                                 "best_practices.cpp",
+                                                 "spirv_validation_helper.cpp",
+                                                 "spirv_grammar_helper.cpp",
+                                                 "spirv_grammar_helper.h",
+                                                 "command_validation.cpp",
+                                                 "command_validation.h",
+                                                 "vk_format_utils.cpp",
+                                                 "vk_format_utils.h",
+                                                 "corechecks_optick_instrumentation.cpp",
+                                                 "corechecks_optick_instrumentation.h"]]
+
+    # These read files written by lvl_genvk.py (vk_validation_stats.py scans the generated sources), so they run afterwards
+    post_gen_cmds = [[common_codegen.repo_relative('scripts/vk_validation_stats.py'),
+                     os.path.abspath(os.path.join(args.registry, 'validusage.json')),
+                     '-export_header'],
+                    [common_codegen.repo_relative('scripts/external_revision_generator.py'),
+                     '--json_file', common_codegen.repo_relative('scripts/known_good.json'),
+                     '--json_keys', 'repos,3,commit',
+                     '-s', 'SPIRV_TOOLS_COMMIT_ID',
+                     '-o', 'spirv_tools_commit_id.h']]
 
     repo_dir = common_codegen.repo_relative('layers/generated')
 
@@ -103,12 +110,33 @@ def main(argv):
         gen_dir = repo_dir
 
     # run each code generator
-    for cmd in gen_cmds:
+    def run_generator(cmd):
+        subprocess.check_call([sys.executable] + cmd, cwd=gen_dir)
+
+    # Every lvl_genvk.py process parses all of vk.xml, so bound how many run at once to keep memory use in check
+    max_workers = min(os.cpu_count() or 1, max_concurrent_generators)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # echo each command from this thread as it is submitted, so the log order doesn't depend on the pool
+        futures = []
+        for cmd in lvl_genvk_cmds:
+            print(' '.join(cmd))
+            futures.append((cmd, executor.submit(run_generator, cmd)))
+        for cmd, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                print('ERROR:', ' '.join(cmd), '-', str(e))
+                # don't start any generators that are still queued
+                for _, pending in futures:
+                    pending.cancel()
+                return 1
+
+    for cmd in post_gen_cmds:
         print(' '.join(cmd))
         try:
-            subprocess.check_call([sys.executable] + cmd, cwd=gen_dir)
+            run_generator(cmd)
         except Exception as e:
-            print('ERROR:', str(e))
+            print('ERROR:', ' '.join(cmd), '-', str(e))
             return 1
 
     # optional post-generation steps